@@ -18,8 +18,13 @@ def sum_multiples_below(n: int, m: int) -> int:
     """
     Calculate sum of all multiples of m below n using arithmetic series formula.
     
-    Formula: m × k × (k + 1) / 2, where k = (n - 1) // m
-    
+    Formula: m × (k × (k + 1) / 2), where k = (n - 1) // m
+
+    k × (k + 1) is always even, so the halving is done before the final
+    multiply; the intermediate products stay as small as possible, which
+    keeps CPython's arbitrary-precision arithmetic on its fastest path
+    for large N.
+
     Time Complexity: O(1)
     
     Args:
@@ -37,7 +42,7 @@ def sum_multiples_below(n: int, m: int) -> int:
         return 0
     
     k = (n - 1) // m
-    return m * k * (k + 1) // 2
+    return m * (k * (k + 1) // 2)
 
 
 def calculate_sum_3_or_5(n: int) -> int:
@@ -46,9 +51,14 @@ def calculate_sum_3_or_5(n: int) -> int:
     
     Uses inclusion-exclusion principle:
     Sum = (multiples of 3) + (multiples of 5) - (multiples of 15)
-    
+
+    The three series are evaluated inline rather than through
+    sum_multiples_below: this sits on the per-test-case path, and
+    inlining saves two function-call frames per call while letting
+    (n - 1) be computed once for all three divisors.
+
     Time Complexity: O(1)
-    
+
     Args:
         n: Upper bound (exclusive)
         
@@ -61,40 +71,41 @@ def calculate_sum_3_or_5(n: int) -> int:
         >>> calculate_sum_3_or_5(100)
         2318
     """
-    sum_3 = sum_multiples_below(n, 3)
-    sum_5 = sum_multiples_below(n, 5)
-    sum_15 = sum_multiples_below(n, 15)
-    
-    return sum_3 + sum_5 - sum_15
+    m = n - 1
+    k3 = m // 3
+    k5 = m // 5
+    k15 = m // 15
+
+    return (3 * (k3 * (k3 + 1) // 2)
+            + 5 * (k5 * (k5 + 1) // 2)
+            - 15 * (k15 * (k15 + 1) // 2))
 
 
 def solve_test_cases(test_cases: List[int]) -> List[int]:
     """
-    Solve multiple test cases efficiently using deduplication.
-    
+    Solve multiple test cases in a single pass.
+
     Strategy:
-    1. Find unique N values from all test cases
-    2. Calculate sum once for each unique N (O(1) per unique value)
-    3. Map results back to original test case order
-    
-    Time Complexity: O(U) where U = number of unique values
-    Space Complexity: O(U) for the cache
-    
+        Each answer is O(1) arithmetic, so deduplicating inputs costs more
+        than it saves: building the set and dict and hashing every N is
+        strictly more work than just evaluating the formula per test case.
+        map() drives the batch loop from C, so the only Python-level work
+        per test case is the formula call itself.
+
+    Time Complexity: O(T) where T = number of test cases
+    Space Complexity: O(T) for the results
+
     Args:
         test_cases: List of N values (may contain duplicates)
-        
+
     Returns:
         List of sums corresponding to each test case
-        
+
     Example:
         >>> solve_test_cases([10, 100, 10])
         [23, 2318, 23]
     """
-    # Calculate sum once per unique N value
-    unique_sums = {n: calculate_sum_3_or_5(n) for n in set(test_cases)}
-    
-    # Map results back to original order
-    return [unique_sums[n] for n in test_cases]
+    return list(map(calculate_sum_3_or_5, test_cases))
 
 
 def main():
@@ -112,18 +123,20 @@ def main():
     Output Format:
         T lines, each containing the sum for corresponding test case
     """
-    # Read number of test cases
-    t = int(input().strip())
-    
-    # Read all test cases
-    test_cases = [int(input().strip()) for _ in range(t)]
+    # Bulk-read all input at once: at T = 10⁵, per-line input() calls
+    # (one readline plus one str alloc each) dominate the O(1) math
+    data = sys.stdin.buffer.read().split()
+
+    # First token is T, next T tokens are the test cases
+    t = int(data[0])
+    test_cases = list(map(int, data[1:1 + t]))
     
-    # Solve all test cases with deduplication
+    # Solve all test cases
     results = solve_test_cases(test_cases)
     
-    # Output results
-    for result in results:
-        print(result)
+    # Output all results with one write: per-result print() would pay
+    # T lock/flush round trips and T write syscalls
+    sys.stdout.write("\n".join(map(str, results)) + "\n")
 
 
 if __name__ == "__main__":
@@ -16,8 +16,14 @@ Python: 3.14
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import List, Tuple, Dict
 from dataclasses import dataclass
+from pathlib import Path
+import ctypes
+import hashlib
+import math
+import subprocess
 import time
 
 
@@ -27,6 +33,14 @@ import time
 
 DEFAULT_LIMIT = 4_000_000
 
+# Golden-ratio logarithms for the Binet index estimate
+_LOG_PHI = math.log((1 + math.sqrt(5)) / 2)
+_LOG_SQRT5 = math.log(5) / 2
+
+# Above this, the totals-only path switches from the linear recurrence
+# to O(log n) fast doubling
+_FAST_DOUBLING_THRESHOLD = 10**12
+
 
 # ============================================================================
 # DATA STRUCTURES
@@ -39,11 +53,16 @@ class FibonacciFilter(Enum):
     ODD = "odd"
 
 
-@dataclass
+@dataclass(slots=True)
 class FibonacciResult:
     """
     Complete result container for Fibonacci calculations.
-    
+
+    Display formatting lives in format_result(), not on the dataclass:
+    results built as intermediates (solver queries, Dedekind-cut
+    analysis) are never rendered, and slots keeps per-instance storage
+    and attribute access lean.
+
     Attributes:
         filter_type: Which filter was applied
         sum_value: Total sum of filtered terms
@@ -62,28 +81,333 @@ class FibonacciResult:
     lub: int
     limit: int
     computation_time: float = 0.0
-    
-    def __str__(self) -> str:
-        return f"""
-Fibonacci Analysis ({self.filter_type.value.upper()})
+
+
+def format_result(result: FibonacciResult) -> str:
+    """
+    Render a FibonacciResult as the multi-line analysis report.
+
+    Results produced without benchmark=True carry no timing, so the
+    report says "not measured" rather than presenting 0.000 ms as a
+    real measurement.
+
+    Args:
+        result: The result to format
+
+    Returns:
+        Formatted report string
+    """
+    time_display = (f"{result.computation_time*1000:.3f} ms"
+                    if result.computation_time else "not measured")
+
+    return f"""
+Fibonacci Analysis ({result.filter_type.value.upper()})
 {'='*60}
-Limit:            {self.limit:,}
-Sum:              {self.sum_value:,}
-Count:            {self.count}
-GLB:              {self.glb:,}
-LUB:              {self.lub:,}
-Computation Time: {self.computation_time*1000:.3f} ms
-First 10 terms:   {self.sequence[:10]}
-Last 5 terms:     {self.sequence[-5:] if len(self.sequence) >= 5 else self.sequence}
+Limit:            {result.limit:,}
+Sum:              {result.sum_value:,}
+Count:            {result.count}
+GLB:              {result.glb:,}
+LUB:              {result.lub:,}
+Computation Time: {time_display}
+First 10 terms:   {result.sequence[:10]}
+Last 5 terms:     {result.sequence[-5:] if len(result.sequence) >= 5 else result.sequence}
 {'='*60}
         """
 
 
+# ============================================================================
+# NATIVE KERNEL (OPTIONAL)
+# ============================================================================
+
+# The even recurrence E(n) = 4E(n-1) + E(n-2) is pure integer arithmetic,
+# so for limits that fit comfortably in uint64 we can run it as compiled C
+# instead of CPython bytecode. The C source is compiled once with the system
+# compiler and the shared object is cached; if no compiler is available we
+# silently fall back to the pure-Python loop below.
+
+_NATIVE_C_SOURCE = """\
+#include <stdint.h>
+
+uint64_t fib_even_sum(uint64_t limit, uint64_t *out_count,
+                      uint64_t *out_glb, uint64_t *out_lub)
+{
+    uint64_t a = 2, b = 8;  /* E(1) = 2, E(2) = 8 */
+    uint64_t count = 0, glb = 0;
+
+    while (a <= limit) {
+        glb = a;
+        count++;
+        uint64_t t = 4 * b + a;
+        a = b;
+        b = t;
+    }
+
+    *out_count = count;
+    *out_glb = glb;
+    *out_lub = a;
+    /* Telescoping sum: S(k) = (E(k+1) + E(k) - 2) / 4 */
+    return (a + glb - 2) / 4;
+}
+"""
+
+# Beyond this, the look-ahead term b (~18× limit on exit) could overflow
+# uint64, so larger limits stay on the Python bigint path.
+_NATIVE_MAX_LIMIT = 1 << 59
+
+_native_kernel = None
+_native_kernel_loaded = False
+
+
+def _load_native_kernel():
+    """
+    Compile (once) and load the C even-Fibonacci kernel.
+
+    The shared object is cached under a name derived from a hash of the
+    C source, so every later run — and every later process — loads the
+    existing binary instead of invoking the compiler, and any change to
+    the source automatically triggers a rebuild under a fresh name.
+
+    Returns:
+        The ctypes function, or None when compilation/loading fails
+        (no compiler, read-only cache dir, etc.) — callers then use
+        the pure-Python kernel instead.
+    """
+    global _native_kernel, _native_kernel_loaded
+
+    if _native_kernel_loaded:
+        return _native_kernel
+    _native_kernel_loaded = True
+
+    try:
+        cache_dir = Path.home() / ".cache" / "medium-python-articles"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        source_hash = hashlib.sha256(_NATIVE_C_SOURCE.encode()).hexdigest()[:16]
+        lib_path = cache_dir / f"fib_even_kernel-{source_hash}.so"
+
+        if not lib_path.exists():
+            src_path = cache_dir / f"fib_even_kernel-{source_hash}.c"
+            src_path.write_text(_NATIVE_C_SOURCE)
+            subprocess.run(
+                ["cc", "-O3", "-shared", "-fPIC", "-o", str(lib_path), str(src_path)],
+                check=True, capture_output=True
+            )
+
+        lib = ctypes.CDLL(str(lib_path))
+        func = lib.fib_even_sum
+        func.restype = ctypes.c_uint64
+        func.argtypes = [
+            ctypes.c_uint64,
+            ctypes.POINTER(ctypes.c_uint64),
+            ctypes.POINTER(ctypes.c_uint64),
+            ctypes.POINTER(ctypes.c_uint64),
+        ]
+        _native_kernel = func
+    except (OSError, subprocess.SubprocessError):
+        _native_kernel = None
+
+    return _native_kernel
+
+
+# ============================================================================
+# LOOP KERNELS
+# ============================================================================
+
+def _fib_pair(k: int) -> Tuple[int, int]:
+    """
+    Return (F(k), F(k+1)) via fast doubling in O(log k) bigint ops.
+
+    Uses F(2m) = F(m)·(2F(m+1) − F(m)) and F(2m+1) = F(m)² + F(m+1)²,
+    with the classical indexing F(0) = 0, F(1) = 1.
+    """
+    if k == 0:
+        return 0, 1
+
+    f, g = _fib_pair(k >> 1)
+    c = f * (2*g - f)    # F(2m)
+    d = f*f + g*g        # F(2m+1)
+
+    if k & 1:
+        return d, c + d
+    return c, d
+
+
+def _fib_all_totals_fast(limit: int) -> Tuple[int, int, int, int]:
+    """
+    Totals for ALL Fibonacci ≤ limit in O(log limit) bigint ops.
+
+    Estimates the bracketing index from Binet's formula, corrects it by
+    at most a couple of single steps, then reads the sum off the closed
+    form S = F(n+2) − 2 (the module's sequence starts at F(2) = 1).
+
+    Returns:
+        (total, count, glb, lub)
+    """
+    # Binet: F(n) ≈ φⁿ/√5, so n ≈ (ln limit + ln √5) / ln φ
+    idx = max(2, int((math.log(limit) + _LOG_SQRT5) / _LOG_PHI))
+    f, g = _fib_pair(idx)
+
+    # Correct the float estimate so that f = F(idx) ≤ limit < F(idx+1) = g
+    while f > limit:
+        f, g = g - f, f
+        idx -= 1
+    while g <= limit:
+        f, g = g, f + g
+        idx += 1
+
+    # Terms are F(2)..F(idx): count = idx − 1, sum = F(idx+2) − 2
+    return f + g - 2, idx - 1, f, g
+
+
+def _fib_all_kernel(limit: int,
+                    want_sequence: bool = True) -> Tuple[List[int], int, int, int, int]:
+    """
+    Bare recurrence loop for ALL Fibonacci numbers ≤ limit.
+
+    Kept free of timing, dataclass construction and any other wrapper
+    concerns so the hot loop is nothing but integer arithmetic. Callers
+    that only need the totals pass want_sequence=False to skip boxing
+    every term into a list; for very large limits that path also swaps
+    the linear recurrence for O(log n) fast doubling.
+
+    Returns:
+        (sequence, total, count, glb, lub); sequence is empty when
+        want_sequence is False
+    """
+    if not want_sequence and limit > _FAST_DOUBLING_THRESHOLD:
+        total, count, glb, lub = _fib_all_totals_fast(limit)
+        return [], total, count, glb, lub
+
+    sequence = []
+    total = 0
+    count = 0
+    glb = 0
+    a, b = 1, 2
+
+    while a <= limit:
+        if want_sequence:
+            sequence.append(a)
+        total += a
+        count += 1
+        glb = a
+        a, b = b, a + b
+
+    return sequence, total, count, glb, a
+
+
+def _fib_even_kernel(limit: int,
+                     want_sequence: bool = True) -> Tuple[List[int], int, int, int, int]:
+    """
+    Bare direct-recurrence loop for EVEN Fibonacci numbers ≤ limit.
+
+    Uses E(n) = 4E(n-1) + E(n-2), touching only every third Fibonacci
+    term. The sum is not accumulated in the loop: summing the recurrence
+    over k telescopes to S(k) = (E(k+1) + E(k) - 2) / 4, so the total
+    falls out of the GLB/LUB pair in O(1). With want_sequence=False and
+    the native kernel loaded, no Python-level loop runs at all.
+
+    The native kernel is only consulted on the totals-only path: when
+    the caller wants the boxed sequence, the Python loop has to run
+    regardless, and stacking the FFI call (argument marshalling plus
+    three out-parameters) on top of it would cost more than it saves.
+
+    Returns:
+        (sequence, total, count, glb, lub); sequence is empty when
+        want_sequence is False
+    """
+    if not want_sequence:
+        native = _load_native_kernel()
+        if native is not None and 0 <= limit < _NATIVE_MAX_LIMIT:
+            count = ctypes.c_uint64()
+            glb = ctypes.c_uint64()
+            lub = ctypes.c_uint64()
+            total = native(limit, ctypes.byref(count),
+                           ctypes.byref(glb), ctypes.byref(lub))
+
+            return [], total, count.value, glb.value, lub.value
+
+    sequence = []
+    count = 0
+    glb = 0
+    a, b = 2, 8  # E(1) = 2, E(2) = 8
+
+    while a <= limit:
+        if want_sequence:
+            sequence.append(a)
+        count += 1
+        glb = a
+        a, b = b, 4*b + a
+
+    # Telescoping sum: S(k) = (E(k+1) + E(k) - 2) / 4
+    total = (a + glb - 2) // 4
+
+    return sequence, total, count, glb, a
+
+
+def _fib_odd_kernel(limit: int,
+                    want_sequence: bool = True) -> Tuple[List[int], int, int, int, int]:
+    """
+    Bare single-pass loop for ODD Fibonacci numbers ≤ limit.
+
+    Fibonacci parity repeats with period 3 — (odd, even, odd) — so the
+    loop is unrolled into triples: emit, skip, emit. No parity test is
+    needed inside the loop. Callers that only need the totals pass
+    want_sequence=False to skip boxing the terms into a list.
+
+    Returns:
+        (sequence, total, count, glb, lub); sequence is empty when
+        want_sequence is False
+    """
+    sequence = []
+    total = 0
+    count = 0
+    glb = 0
+    a, b = 1, 2
+
+    while True:
+        if a > limit:
+            break
+        if want_sequence:
+            sequence.append(a)  # odd
+        total += a
+        count += 1
+        glb = a
+        a, b = b, a + b
+        if a > limit:
+            break
+        a, b = b, a + b  # even — skip
+        if a > limit:
+            break
+        if want_sequence:
+            sequence.append(a)  # odd
+        total += a
+        count += 1
+        glb = a
+        a, b = b, a + b
+
+    # LUB must be odd; an even exit point needs at most one more step
+    # (two consecutive Fibonacci numbers are never both even)
+    if not a & 1:
+        a, b = b, a + b
+
+    return sequence, total, count, glb, a
+
+
+# Dispatch table: one kernel per filter, resolved by dict lookup instead
+# of an if/elif chain
+_KERNELS = {
+    FibonacciFilter.ALL: _fib_all_kernel,
+    FibonacciFilter.EVEN: _fib_even_kernel,
+    FibonacciFilter.ODD: _fib_odd_kernel,
+}
+
+
 # ============================================================================
 # ALGORITHM 1: ALL FIBONACCI NUMBERS
 # ============================================================================
 
-def fibonacci_all(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
+def fibonacci_all(limit: int = DEFAULT_LIMIT,
+                  benchmark: bool = False) -> FibonacciResult:
     """
     Calculate ALL Fibonacci numbers ≤ limit.
     
@@ -93,7 +417,8 @@ def fibonacci_all(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
     
     Args:
         limit: Upper bound (default 4,000,000)
-        
+        benchmark: When True, measure wall-clock time for the call
+
     Returns:
         FibonacciResult with complete analysis
         
@@ -104,29 +429,18 @@ def fibonacci_all(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
         >>> result.count
         12
     """
-    start_time = time.perf_counter()
-    
-    sequence = []
-    total = 0
-    a, b = 1, 2
-    
+    start_time = time.perf_counter() if benchmark else 0.0
+
     # Generate all Fibonacci ≤ limit
-    while a <= limit:
-        sequence.append(a)
-        total += a
-        a, b = b, a + b
-    
-    # GLB and LUB
-    glb = sequence[-1] if sequence else 0
-    lub = a  # First term > limit
-    
-    end_time = time.perf_counter()
-    
+    sequence, total, count, glb, lub = _fib_all_kernel(limit)
+
+    end_time = time.perf_counter() if benchmark else 0.0
+
     return FibonacciResult(
         filter_type=FibonacciFilter.ALL,
         sum_value=total,
         sequence=sequence,
-        count=len(sequence),
+        count=count,
         glb=glb,
         lub=lub,
         limit=limit,
@@ -138,7 +452,8 @@ def fibonacci_all(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
 # ALGORITHM 2: EVEN FIBONACCI NUMBERS (OPTIMIZED)
 # ============================================================================
 
-def fibonacci_even_optimized(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
+def fibonacci_even_optimized(limit: int = DEFAULT_LIMIT,
+                             benchmark: bool = False) -> FibonacciResult:
     """
     Calculate EVEN Fibonacci numbers ≤ limit using DIRECT RECURRENCE.
     
@@ -150,7 +465,8 @@ def fibonacci_even_optimized(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
     
     Args:
         limit: Upper bound (default 4,000,000)
-        
+        benchmark: When True, measure wall-clock time for the call
+
     Returns:
         FibonacciResult with complete analysis
         
@@ -163,29 +479,18 @@ def fibonacci_even_optimized(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
         >>> result.sequence
         [2, 8, 34]
     """
-    start_time = time.perf_counter()
-    
-    sequence = []
-    total = 0
-    a, b = 2, 8  # E(1) = 2, E(2) = 8
-    
-    # Generate even Fibonacci using direct recurrence
-    while a <= limit:
-        sequence.append(a)
-        total += a
-        a, b = b, 4*b + a  # Direct even recurrence!
-    
-    # GLB and LUB
-    glb = sequence[-1] if sequence else 0
-    lub = a  # First even term > limit
-    
-    end_time = time.perf_counter()
-    
+    start_time = time.perf_counter() if benchmark else 0.0
+
+    # Generate even Fibonacci using the direct recurrence kernel
+    sequence, total, count, glb, lub = _fib_even_kernel(limit)
+
+    end_time = time.perf_counter() if benchmark else 0.0
+
     return FibonacciResult(
         filter_type=FibonacciFilter.EVEN,
         sum_value=total,
         sequence=sequence,
-        count=len(sequence),
+        count=count,
         glb=glb,
         lub=lub,
         limit=limit,
@@ -193,7 +498,8 @@ def fibonacci_even_optimized(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
     )
 
 
-def fibonacci_even_filtered(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
+def fibonacci_even_filtered(limit: int = DEFAULT_LIMIT,
+                            benchmark: bool = False) -> FibonacciResult:
     """
     Calculate EVEN Fibonacci using filter (SLOWER - for comparison).
     
@@ -205,11 +511,12 @@ def fibonacci_even_filtered(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
     
     Args:
         limit: Upper bound
-        
+        benchmark: When True, measure wall-clock time for the call
+
     Returns:
         FibonacciResult with complete analysis
     """
-    start_time = time.perf_counter()
+    start_time = time.perf_counter() if benchmark else 0.0
     
     sequence = []
     total = 0
@@ -217,19 +524,19 @@ def fibonacci_even_filtered(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
     
     # Generate all, keep only evens
     while a <= limit:
-        if a % 2 == 0:
+        if not a & 1:
             sequence.append(a)
             total += a
         a, b = b, a + b
     
     # Find LUB (next even)
-    while a % 2 == 1:
+    while a & 1:
         a, b = b, a + b
     
     glb = sequence[-1] if sequence else 0
     lub = a
     
-    end_time = time.perf_counter()
+    end_time = time.perf_counter() if benchmark else 0.0
     
     return FibonacciResult(
         filter_type=FibonacciFilter.EVEN,
@@ -247,17 +554,22 @@ def fibonacci_even_filtered(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
 # ALGORITHM 3: ODD FIBONACCI NUMBERS
 # ============================================================================
 
-def fibonacci_odd_filtered(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
+def fibonacci_odd_filtered(limit: int = DEFAULT_LIMIT,
+                           benchmark: bool = False) -> FibonacciResult:
     """
     Calculate ODD Fibonacci numbers using filtering.
-    
-    Method: Generate all, filter odds
+
+    Method: Generate all, skip evens. The parity pattern of Fibonacci
+    repeats with period 3 (odd, even, odd), so the loop is unrolled into
+    triples and never tests `a % 2` — each position's parity is known
+    statically.
     Time: O(n)
     Space: O(2n/3) for odd sequence
     
     Args:
         limit: Upper bound (default 4,000,000)
-        
+        benchmark: When True, measure wall-clock time for the call
+
     Returns:
         FibonacciResult with complete analysis
         
@@ -268,27 +580,39 @@ def fibonacci_odd_filtered(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
         >>> result.count
         8
     """
-    start_time = time.perf_counter()
+    start_time = time.perf_counter() if benchmark else 0.0
     
     sequence = []
     total = 0
     a, b = 1, 2
-    
-    # Generate Fibonacci, keep only odds
-    while a <= limit:
-        if a % 2 == 1:
-            sequence.append(a)
-            total += a
+
+    # Generate Fibonacci, keep only odds — unrolled over the period-3
+    # parity pattern: emit, skip, emit
+    while True:
+        if a > limit:
+            break
+        sequence.append(a)  # odd
+        total += a
         a, b = b, a + b
-    
-    # Find LUB (next odd)
-    while a <= limit or a % 2 == 0:
+        if a > limit:
+            break
+        a, b = b, a + b  # even — skip
+        if a > limit:
+            break
+        sequence.append(a)  # odd
+        total += a
         a, b = b, a + b
-    
+
+    # Find LUB (next odd): the main loop already left a > limit, and two
+    # consecutive Fibonacci numbers are never both even, so an even exit
+    # point needs exactly one more step
+    if not a & 1:
+        a, b = b, a + b
+
     glb = sequence[-1] if sequence else 0
     lub = a
     
-    end_time = time.perf_counter()
+    end_time = time.perf_counter() if benchmark else 0.0
     
     return FibonacciResult(
         filter_type=FibonacciFilter.ODD,
@@ -302,50 +626,38 @@ def fibonacci_odd_filtered(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
     )
 
 
-def fibonacci_odd_difference(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
+def fibonacci_odd_difference(limit: int = DEFAULT_LIMIT,
+                             benchmark: bool = False) -> FibonacciResult:
     """
-    Calculate ODD sum using difference method (FASTEST).
-    
-    Method: Sum(Odd) = Sum(All) - Sum(Even)
-    This is faster because we can use optimized even calculation!
-    
-    Time: O(n)
-    Space: O(1) for computation, O(n) if we want sequence
-    
+    Calculate ODD Fibonacci numbers in a single pass (FASTEST).
+
+    Method: Parity-unrolled generation — Fibonacci parity has period 3
+    (odd, odd, even), so the kernel emits two odds then skips the even
+    without ever testing parity. This replaces the earlier difference
+    method Sum(Odd) = Sum(All) - Sum(Even), which generated the full
+    sequence AND the even sequence, then filtered — three passes!
+
+    Time: O(n), single pass
+    Space: O(2n/3) for odd sequence
+
     Args:
         limit: Upper bound
-        
+        benchmark: When True, measure wall-clock time for the call
+
     Returns:
         FibonacciResult with complete analysis
     """
-    start_time = time.perf_counter()
-    
-    # Get all and even results
-    all_result = fibonacci_all(limit)
-    even_result = fibonacci_even_optimized(limit)
-    
-    # Calculate odd sequence by filtering all
-    odd_sequence = [f for f in all_result.sequence if f % 2 == 1]
-    
-    # Calculate odd sum by difference (faster!)
-    odd_sum = all_result.sum_value - even_result.sum_value
-    
-    # Find LUB
-    a = all_result.lub
-    b = a + all_result.glb
-    while a % 2 == 0:
-        a, b = b, a + b
-    
-    glb = odd_sequence[-1] if odd_sequence else 0
-    lub = a
-    
-    end_time = time.perf_counter()
-    
+    start_time = time.perf_counter() if benchmark else 0.0
+
+    odd_sequence, odd_sum, count, glb, lub = _fib_odd_kernel(limit)
+
+    end_time = time.perf_counter() if benchmark else 0.0
+
     return FibonacciResult(
         filter_type=FibonacciFilter.ODD,
         sum_value=odd_sum,
         sequence=odd_sequence,
-        count=len(odd_sequence),
+        count=count,
         glb=glb,
         lub=lub,
         limit=limit,
@@ -353,10 +665,61 @@ def fibonacci_odd_difference(limit: int = DEFAULT_LIMIT) -> FibonacciResult:
     )
 
 
+# ============================================================================
+# TOTALS-ONLY FAST PATH
+# ============================================================================
+
+def fibonacci_totals(filter_type: FibonacciFilter = FibonacciFilter.EVEN,
+                     limit: int = DEFAULT_LIMIT) -> Tuple[int, int, int, int]:
+    """
+    Calculate sum/count/GLB/LUB without materializing the sequence.
+
+    This is the entry point for sum-only queries: the kernels run with
+    want_sequence=False, so no terms are boxed into a list, the EVEN
+    path can complete entirely in native code, and ALL-filter queries
+    with limits above 10¹² switch to the O(log n) fast-doubling path.
+
+    Args:
+        filter_type: Which terms to include (ALL, EVEN, or ODD)
+        limit: Upper bound (default 4,000,000)
+
+    Returns:
+        (sum_value, count, glb, lub)
+
+    Example:
+        >>> fibonacci_totals(FibonacciFilter.EVEN, 100)
+        (44, 3, 34, 144)
+    """
+    kernel = _KERNELS.get(filter_type)
+    if kernel is None:
+        raise ValueError(f"Unknown filter type: {filter_type}")
+
+    _, total, count, glb, lub = kernel(limit, want_sequence=False)
+    return total, count, glb, lub
+
+
 # ============================================================================
 # UNIFIED FIBONACCI SOLVER
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _solve_cached(limit: int, filter_type: FibonacciFilter) -> Tuple[Tuple[int, ...], int, int, int, int]:
+    """
+    Memoized solve keyed on (limit, filter_type).
+
+    The demos query the same limit repeatedly (solve_all_three plus one
+    Dedekind cut per filter), so the kernel runs once per key. The cache
+    holds a frozen (sequence, total, count, glb, lub) tuple rather than
+    a FibonacciResult, whose sequence list is mutable; callers re-wrap.
+    """
+    kernel = _KERNELS.get(filter_type)
+    if kernel is None:
+        raise ValueError(f"Unknown filter type: {filter_type}")
+
+    sequence, total, count, glb, lub = kernel(limit)
+    return tuple(sequence), total, count, glb, lub
+
+
 class UnifiedFibonacciSolver:
     """
     Unified Fibonacci solver with configurable filtering.
@@ -373,25 +736,41 @@ class UnifiedFibonacciSolver:
             limit: Maximum Fibonacci value to consider
         """
         self.limit = limit
+        # Per-instance result cache: solve_all_three, verify_results and
+        # the Dedekind-cut analysis all re-query the same filters
+        self._results: Dict[FibonacciFilter, FibonacciResult] = {}
     
     def solve(self, filter_type: FibonacciFilter = FibonacciFilter.EVEN) -> FibonacciResult:
         """
         Solve for specified filter type using optimal algorithm.
-        
+
+        Repeated calls for the same filter reuse the memoized kernel
+        result instead of re-running the loop, and each instance hands
+        back the same FibonacciResult object on repeat queries.
+
         Args:
             filter_type: Which terms to include (ALL, EVEN, or ODD)
-            
+
         Returns:
             FibonacciResult with complete analysis
         """
-        if filter_type == FibonacciFilter.ALL:
-            return fibonacci_all(self.limit)
-        elif filter_type == FibonacciFilter.EVEN:
-            return fibonacci_even_optimized(self.limit)
-        elif filter_type == FibonacciFilter.ODD:
-            return fibonacci_odd_difference(self.limit)
-        else:
-            raise ValueError(f"Unknown filter type: {filter_type}")
+        result = self._results.get(filter_type)
+        if result is not None:
+            return result
+
+        sequence, total, count, glb, lub = _solve_cached(self.limit, filter_type)
+
+        result = FibonacciResult(
+            filter_type=filter_type,
+            sum_value=total,
+            sequence=list(sequence),
+            count=count,
+            glb=glb,
+            lub=lub,
+            limit=self.limit
+        )
+        self._results[filter_type] = result
+        return result
     
     def solve_all_three(self) -> Tuple[FibonacciResult, FibonacciResult, FibonacciResult]:
         """
@@ -435,6 +814,7 @@ class DedekindCut:
         lub: Least Upper Bound
         glb_index: Index of GLB in Fibonacci sequence
         lub_index: Index of LUB in Fibonacci sequence
+        sum_value: Sum of the lower set (already known by the solver)
     """
     limit: int
     lower_set: List[int]
@@ -443,6 +823,7 @@ class DedekindCut:
     lub: int
     glb_index: int
     lub_index: int
+    sum_value: int
     
     def __str__(self) -> str:
         return f"""
@@ -459,7 +840,7 @@ LUB (Least Upper Bound):
 Lower Set (L): {len(self.lower_set)} elements
   First 5:  {self.lower_set[:5]}
   Last 5:   {self.lower_set[-5:] if len(self.lower_set) >= 5 else self.lower_set}
-  Sum:      {sum(self.lower_set):,}
+  Sum:      {self.sum_value:,}
 
 Upper Set (U): Showing first {len(self.upper_set)} elements
   Elements: {self.upper_set}
@@ -502,7 +883,7 @@ def analyze_dedekind_cut(filter_type: FibonacciFilter = FibonacciFilter.ALL,
         for _ in range(3):
             upper_set.append(b)
             a, b = b, a + b
-            if filter_type == FibonacciFilter.ODD and b % 2 == 0:
+            if filter_type == FibonacciFilter.ODD and not b & 1:
                 a, b = b, a + b  # Skip evens
     
     return DedekindCut(
@@ -512,7 +893,8 @@ def analyze_dedekind_cut(filter_type: FibonacciFilter = FibonacciFilter.ALL,
         glb=result.glb,
         lub=result.lub,
         glb_index=result.count,
-        lub_index=result.count + 1
+        lub_index=result.count + 1,
+        sum_value=result.sum_value
     )
 
 
@@ -533,14 +915,14 @@ def compare_even_algorithms(limit: int = DEFAULT_LIMIT):
     
     # Method 1: Optimized (Direct Recurrence)
     print("🚀 METHOD 1: DIRECT RECURRENCE E(n) = 4E(n-1) + E(n-2)")
-    result1 = fibonacci_even_optimized(limit)
+    result1 = fibonacci_even_optimized(limit, benchmark=True)
     print(f"   Time: {result1.computation_time*1000:.4f} ms")
     print(f"   Sum:  {result1.sum_value:,}")
     print()
     
     # Method 2: Filtered (Generate All)
     print("🐌 METHOD 2: GENERATE ALL, FILTER EVENS")
-    result2 = fibonacci_even_filtered(limit)
+    result2 = fibonacci_even_filtered(limit, benchmark=True)
     print(f"   Time: {result2.computation_time*1000:.4f} ms")
     print(f"   Sum:  {result2.sum_value:,}")
     print()
@@ -572,15 +954,19 @@ def demonstrate_all_three():
     all_result, even_result, odd_result = solver.solve_all_three()
     
     # Display results
-    print(all_result)
-    print(even_result)
-    print(odd_result)
+    print(format_result(all_result))
+    print(format_result(even_result))
+    print(format_result(odd_result))
     
     # Verification
     print("\n" + "="*70)
     print("VERIFICATION: Sum(All) = Sum(Even) + Sum(Odd)")
     print("="*70)
-    is_valid = solver.verify_results(all_result, even_result, odd_result)
+    # Cross-check against the totals-only fast path, which recomputes
+    # the ALL sum without ever materializing a sequence
+    totals_sum, _, _, _ = fibonacci_totals(FibonacciFilter.ALL, DEFAULT_LIMIT)
+    is_valid = (solver.verify_results(all_result, even_result, odd_result)
+                and all_result.sum_value == totals_sum)
     print(f"\n{all_result.sum_value:,} = {even_result.sum_value:,} + {odd_result.sum_value:,}")
     print(f"\n{'✓ VERIFIED!' if is_valid else '✗ VERIFICATION FAILED!'}\n")
 